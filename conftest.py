@@ -0,0 +1,51 @@
+import socket
+import urllib.parse
+import pytest
+from il_supermarket_scarper.scrappers_factory import ScraperFactory
+
+
+def _scraper_address(scraper_name, folder_name):
+    """Return the (host, port) the given scraper downloads its files from"""
+    scraper = ScraperFactory.get(scraper_name)(folder_name=folder_name)
+    if hasattr(scraper, "ftp_host"):
+        return scraper.ftp_host, 21
+    url = urllib.parse.urlsplit(scraper.url)
+    return url.hostname, url.port or (443 if url.scheme == "https" else 80)
+
+
+@pytest.fixture(scope="session")
+def enabled_scrapers():
+    """Scrapers sampled once per session and shared by every test"""
+    return tuple(ScraperFactory.sample(1))
+
+
+@pytest.fixture(scope="session")
+def scrapers_reachable(enabled_scrapers, tmp_path_factory):
+    """Skip the requesting test up front when a sampled chain's site is unreachable"""
+    folder_name = str(tmp_path_factory.mktemp("probe"))
+    for scraper_name in enabled_scrapers:
+        address = _scraper_address(scraper_name, folder_name)
+        try:
+            socket.create_connection(address, timeout=2).close()
+        except OSError:
+            pytest.skip(f"{scraper_name} endpoint {address[0]} is unreachable")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "real_kaggle: allow the test to upload to the real Kaggle dataset"
+    )
+
+
+@pytest.fixture(autouse=True)
+def _mock_kaggle(request, monkeypatch):
+    """Keep KaggleUploader off the network unless the test is marked real_kaggle"""
+    if request.node.get_closest_marker("real_kaggle"):
+        return
+    monkeypatch.setattr(
+        "remotes.KaggleUploader._authenticated_api", classmethod(lambda cls: None)
+    )
+    monkeypatch.setattr("remotes.KaggleUploader.increase_index", lambda self: None)
+    monkeypatch.setattr(
+        "remotes.KaggleUploader.upload_to_dataset", lambda self, message: None
+    )
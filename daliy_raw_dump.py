@@ -1,6 +1,6 @@
 import shutil
-import schedule
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import pytz
 import logging
 import datetime
@@ -37,7 +37,11 @@ class BaseSupermarketDataPublisher:
         self.today = datetime.datetime.now()
         self.when_date = when_date if when_date else self.today
         self.number_of_scraping_processes = number_of_scraping_processes
-        self.number_of_parseing_processs = number_of_parseing_processs if number_of_parseing_processs else number_of_scraping_processes - 2
+        self.number_of_parseing_processs = (
+            number_of_parseing_processs
+            if number_of_parseing_processs
+            else max(1, number_of_scraping_processes - 2)
+        )
         self.app_folder = app_folder
         self.data_folder = os.path.join(app_folder, self._dump_folder_name(data_folder))
         self.outputs_folder = os.path.join(app_folder, outputs_folder)
@@ -48,7 +52,7 @@ class BaseSupermarketDataPublisher:
         self.enabled_file_types = enabled_file_types
         self.limit = limit
 
-        logging.info(f"app_folder={app_folder}")
+        logging.info("app_folder=%s", app_folder)
 
     def _dump_folder_name(self, data_folder):
         return data_folder  # f"{data_folder}_{self.today.strftime('%Y%m%d')}" # TBD: if we want to add the date we need to make sure hte publisher will get the correct date
@@ -74,7 +78,7 @@ class BaseSupermarketDataPublisher:
             ).start()
             logging.info("Scraping task is done")
         except Exception as e:
-            logging.error(f"An error occurred during scraping: {e}")
+            logging.error("An error occurred during scraping: %s", e)
             raise e
 
     def _execute_converting(self):
@@ -120,10 +124,21 @@ class BaseSupermarketDataPublisher:
         # Clean the folders in case of an error
         for folder in [self.data_folder]:
             if os.path.exists(folder):
-                for filename in os.listdir(folder):
-                    file_path = os.path.join(folder, filename)
-                    if file_path != self.status_folder:
-                        shutil.rmtree(file_path)
+                dump_folders = []
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.path == self.status_folder:
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            dump_folders.append(entry.path)
+                        else:
+                            os.remove(entry.path)
+                if dump_folders:
+                    # each chain has its own dump folder, remove them concurrently
+                    with ThreadPoolExecutor(
+                        max_workers=min(8, len(dump_folders))
+                    ) as executor:
+                        list(executor.map(shutil.rmtree, dump_folders))
 
     def _clean_all_source_data(self):
         # Clean the folders in case of an error
@@ -138,11 +153,11 @@ class SupermarketDataPublisherInterface(BaseSupermarketDataPublisher):
         super().__init__(**kwargs)
 
     def run(self, operations):
-        logging.info(f"Starting executing DAG = {operations}")
+        logging.info("Starting executing DAG = %s", operations)
         self._check_tz()
         for operation in operations.split(","):
 
-            logging.info(f"Starting the operation={operation}")
+            logging.info("Starting the operation=%s", operation)
             if operation == "scraping":
                 self._execute_scraping()
             elif operation == "converting":
@@ -201,27 +216,48 @@ class SupermarketDataPublisher(SupermarketDataPublisherInterface):
         self.completed_by = completed_by if completed_by else self._end_of_day()
         self.start_at = start_at if start_at else self._non()
         self.executed_jobs = 0
+        self._executed_jobs_lock = threading.Lock()
+        self._all_jobs_executed = threading.Event()
+        self._scheduler = self._create_scheduler()
         self.occasions = self._compute_occasions()
 
+    def _create_scheduler(self):
+        """Create the scheduler, importing schedule only for scheduled publishers"""
+        import schedule
+
+        return schedule.Scheduler()
+
     def _setup_schedule(self, operations):
-        logging.info(f"Scheduling the scraping tasks at {self.occasions}")
+        logging.info("Scheduling the scraping tasks at %s", self.occasions)
         for occasion in self.occasions:
-            schedule.every().day.at(occasion).do(self._execute_operations, operations)
+            self._scheduler.every().day.at(occasion).do(
+                self._execute_operations, operations
+            )
 
     def _execute_operations(self, operations):
         try:
             super().run(operations)
         finally:
-            self.executed_jobs += 1
+            with self._executed_jobs_lock:
+                self.executed_jobs += 1
+                if self.executed_jobs >= len(self.occasions):
+                    self._all_jobs_executed.set()
             logging.info("Scraping task is done")
 
     def _track_task(self):
         logging.info("Starting the tracking tasks")
-        while self.executed_jobs < len(self.occasions):
-            schedule.run_pending()
-            time.sleep(1)
+        while not self._all_jobs_executed.is_set():
+            self._scheduler.run_pending()
+            self._all_jobs_executed.wait(timeout=self._seconds_to_next_job())
         logging.info("Scraping tasks are done, starting the converting task")
 
+    def _seconds_to_next_job(self):
+        """Return the number of seconds until the next scheduled job is due"""
+        idle_seconds = self._scheduler.idle_seconds
+        if idle_seconds is None:
+            return 1
+        return max(idle_seconds, 0)
+
     def _compute_occasions(self):
         """Compute the occasions for the scraping tasks"""
         interval_start = max(self.start_at, self.today)
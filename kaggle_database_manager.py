@@ -4,7 +4,7 @@ import json
 import datetime
 import pytz
 import logging
-from remotes import KaggleUploader
+from remotes import KaggleUploader, replace_with_link
 
 
 class RemoteDatasetManager:
@@ -27,7 +27,7 @@ class RemoteDatasetManager:
         )
         self.dataset_path = os.path.join(app_folder, self.dataset)
         self.remote_database = remote_upload_class(dataset_remote_name=dataset, dataset_path=self.dataset_path,when=self.when)
-        logging.info(f"Dataset path: {self.dataset_path}")
+        logging.info("Dataset path: %s", self.dataset_path)
 
     def _now(self):
         return datetime.datetime.now(pytz.timezone("Asia/Jerusalem")).strftime(
@@ -88,8 +88,18 @@ class RemoteDatasetManager:
                     },
                     file,
                 )
-            shutil.copytree(outputs_folder, self.dataset_path, dirs_exist_ok=True)
-            shutil.copytree(status_folder, self.dataset_path, dirs_exist_ok=True)
+            shutil.copytree(
+                outputs_folder,
+                self.dataset_path,
+                copy_function=replace_with_link,
+                dirs_exist_ok=True,
+            )
+            shutil.copytree(
+                status_folder,
+                self.dataset_path,
+                copy_function=replace_with_link,
+                dirs_exist_ok=True,
+            )
 
             self.remote_database.increase_index()
 
@@ -106,7 +116,7 @@ class RemoteDatasetManager:
                 message=f"Update-Time: {self.when}, Scrapers:{self.enabled_scrapers}, Files:{self.enabled_file_types}"
             )
         except Exception as e:
-            logging.critical(f"Error uploading file: {e}")
+            logging.critical("Error uploading file: %s", e)
             raise ValueError(f"Error uploading file: {e}")
 
     def clean(self):
@@ -1,9 +1,19 @@
 from abc import ABC, abstractmethod
-from kaggle import KaggleApi
 import os
 import logging
 import json
 import shutil
+import threading
+
+
+def replace_with_link(src, dst):
+    """Replace dst with a hard link to src, copying when linking is not possible"""
+    if os.path.lexists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
 
 class RemoteDatabaseUploader(ABC):
     """
@@ -52,26 +62,44 @@ class Dummy(RemoteDatabaseUploader):
         Upload the dataset.
         """
         logging.info(
-            f"Uploading dataset '{self.dataset_remote_name}' to remote database, message {message}"
+            "Uploading dataset '%s' to remote database, message %s",
+            self.dataset_remote_name,
+            message,
         )
         server_path = f"remote_{self.dataset_remote_name}"
         os.makedirs(server_path, exist_ok=True)
-        for filename in os.listdir(self.dataset_path):
-            file_path = os.path.join(self.dataset_path, filename)
-            if os.path.isfile(file_path):
-                shutil.copy(file_path, server_path)
+        with os.scandir(self.dataset_path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    replace_with_link(entry.path, os.path.join(server_path, entry.name))
         
     def clean(self):
         pass
 
 class KaggleUploader(RemoteDatabaseUploader):
 
+    _shared_api = None
+    _api_lock = threading.Lock()
+
     def __init__(self, dataset_remote_name, dataset_path, when):
         self.dataset_remote_name = dataset_remote_name
         self.dataset_path = dataset_path
         self.when = when
-        self.api = KaggleApi()
-        self.api.authenticate()
+        self.api = self._authenticated_api()
+
+    @classmethod
+    def _authenticated_api(cls):
+        """
+        Return a KaggleApi shared by all uploaders, authenticating it on first use.
+        """
+        with cls._api_lock:
+            if cls._shared_api is None:
+                from kaggle import KaggleApi
+
+                api = KaggleApi()
+                api.authenticate()
+                cls._shared_api = api
+            return cls._shared_api
 
     def increase_index(self):
         """
@@ -84,15 +112,15 @@ class KaggleUploader(RemoteDatabaseUploader):
         self.api.dataset_download_cli(
             f"erlichsefi/{self.dataset_remote_name}", file_name="index.json", force=True
         )
-        print(f"Dataset '{self.dataset_remote_name}' downloaded successfully")
+        logging.info("Dataset '%s' downloaded successfully", self.dataset_remote_name)
 
         with open("index.json", "r") as file:
             index = json.load(file)
 
-        index[max(map(int, index.keys())) + 1] = self.when
+        index[str(max(int(key) for key in index) + 1)] = self.when
 
         with open(os.path.join(self.dataset_path, "index.json"), "w+") as file:
-            json.dump(index, file)
+            json.dump(index, file, separators=(",", ":"))
 
     def upload_to_dataset(self, message):
         self.api.dataset_create_version(
@@ -102,4 +130,5 @@ class KaggleUploader(RemoteDatabaseUploader):
         )
 
     def clean(self):
-        os.remove("index.json")
\ No newline at end of file
+        if os.path.exists("index.json"):
+            os.remove("index.json")
@@ -5,16 +5,17 @@ import shutil
 import os
 import datetime
 from daliy_raw_dump import SupermarketDataPublisher
-from il_supermarket_scarper.scrappers_factory import ScraperFactory
 from il_supermarket_scarper import FileTypesFilters
 from remotes import Dummy
 
 
-def test_daliy_raw_dump():
+def test_daliy_raw_dump(tmp_path, monkeypatch, enabled_scrapers, scrapers_reachable):
+    # Dummy writes its remote folder relative to the working directory
+    monkeypatch.chdir(tmp_path)
     # params
     num_of_occasions = 3
     file_per_run = None
-    app_folder = "app_data"
+    app_folder = str(tmp_path / "app_data")
     data_folder = "dumps"
     when_date = None#datetime.datetime(2025,1,10,0,0,0)
 
@@ -23,7 +24,9 @@ def test_daliy_raw_dump():
         remote_upload_class=Dummy,
         app_folder=app_folder,
         data_folder=data_folder,
-        enabled_scrapers=ScraperFactory.sample(1),
+        number_of_scraping_processes=min(len(enabled_scrapers), os.cpu_count() or 1),
+        number_of_parseing_processs=os.cpu_count() or 1,
+        enabled_scrapers=list(enabled_scrapers),
         enabled_file_types=None,
         limit=file_per_run,
         start_at=datetime.datetime.now(),
@@ -33,6 +36,3 @@ def test_daliy_raw_dump():
         when_date=when_date
     )
     publisher.run(itreative_operations='scraping,converting,clean_dump_files',final_operations='publishing,clean_all_source_data')
-    
-
-test_daliy_raw_dump()